@@ -0,0 +1,108 @@
+""" Cached dealer outcome distributions, for EV analysis.
+
+The probability of each dealer final value depends only on the
+  dealer's upcard and the composition of the remaining deck, and the
+  same compositions recur constantly across analyzed player hands.
+Each result is therefore cached under a combinadic address computed
+  from the multiset of cards removed from a full deck, so recurring
+  compositions cost a single dict lookup instead of re-enumerating
+  every dealer draw sequence.
+
+"""
+
+import math
+
+from main import RANK_IS_ACE, RANK_SHORT, RANK_VALUE
+
+DEALER_STAND = 17
+
+# _T[j][x] is the number of multisets of size j drawn from x ranks,
+#   the binomial C(x + j - 1, j); term j of the combinadic address.
+_T = tuple(
+    tuple(math.comb(max(x + j - 1, 0), j) for x in range(53))
+    for j in range(53)
+)
+
+_cache = {}
+
+def address(removed):
+    """ Return the combinadic address of a removed-card multiset.
+
+    `removed` is a sequence of removed rank indexes sorted in
+      descending order. Distinct multisets of the same size map to
+      distinct addresses.
+
+    """
+
+    addr = 0
+    num_removed = len(removed)
+    for i in range(num_removed):
+        addr += _T[i + 1][removed[num_removed - i - 1]]
+
+    return addr
+
+def dealer_outcomes(counts, upcard_rank):
+    """ Return P(dealer ends on 17, 18, 19, 20, 21, bust) as a tuple.
+
+    `counts` is a 13-element sequence of remaining cards per rank and
+      `upcard_rank` the rank of the dealer's visible card. The dealer
+      draws until reaching DEALER_STAND. Results are cached by deck
+      composition and upcard.
+
+    """
+
+    removed = []
+    for rank in range(12, -1, -1):
+        removed.extend([rank] * (4 - counts[rank]))
+
+    cache_key = (len(removed), address(removed), upcard_rank)
+    outcomes = _cache.get(cache_key)
+    if outcomes is not None:
+        return outcomes
+
+    outcome_probs = [0.0] * 6
+    _draw_out(
+        list(counts), sum(counts),
+        RANK_VALUE[upcard_rank], int(RANK_IS_ACE[upcard_rank]),
+        1.0, outcome_probs
+    )
+
+    outcomes = tuple(outcome_probs)
+    _cache[cache_key] = outcomes
+    return outcomes
+
+def _draw_out(counts, num_remaining, hard_total, num_aces, probability,
+              outcome_probs):
+    """ Accumulate outcome probabilities over every dealer draw. """
+
+    hand_value = hard_total
+    if num_aces and hand_value + 10 <= 21:
+        hand_value += 10
+
+    if hand_value >= DEALER_STAND:
+        if hand_value > 21:
+            outcome_probs[5] += probability
+        else:
+            outcome_probs[hand_value - 17] += probability
+        return
+
+    for rank in range(13):
+        count = counts[rank]
+        if count:
+            counts[rank] = count - 1
+            _draw_out(
+                counts, num_remaining - 1,
+                hard_total + RANK_VALUE[rank], num_aces + RANK_IS_ACE[rank],
+                probability * count / num_remaining, outcome_probs
+            )
+            counts[rank] = count
+
+if __name__ == '__main__':
+    full_counts = (4,) * 13
+
+    for upcard_rank in range(13):
+        outcomes = dealer_outcomes(full_counts, upcard_rank)
+        print(
+            f'Upcard {RANK_SHORT[upcard_rank]}:',
+            ' '.join(f'{p:.4f}' for p in outcomes)
+        )
@@ -1,112 +1,133 @@
+import functools
 import math
+import os
 import random
+from array import array
 
-class Card:
-    """ A representation of a playing card.
+# A card is a plain int 0-51, encoded as rank << 2 | suit, so the
+#   rank (0-8 corresponding to 2-10, 9-12 to J, Q, K, A) is card >> 2
+#   and the suit (0-3 corresponding to spades, clubs, diamonds,
+#   hearts) is card & 3 — a single shift or mask, no division.
+# All derived card data is precomputed once into tuples indexed by
+#   that int, so no per-card objects or property calls are needed.
 
-    Card is a node in a stack-based Deck.
+RANK_SHORT = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+SUIT_ICON = ('♠', '♣', '♦', '♥')
 
-    Attributes:
-        rank (int): Card value, 0-12.
-            0-8 corresponding to 2-10.
-            9-12 corresponding to J, Q, K, A respectively.
-        suit (int): Card category.
-            0-3 corresponding to spades, clubs, diamonds, hearts respectively.
-        next_card (Card): The next Card in the deck.
-
-    """
-
-    def __init__(self, rank, suit, next_card=None):
-        self.rank = rank
-        self.suit = suit
-        self.next_card = next_card
+# Hard blackjack value by rank; an ace counts as 1 here and hand
+#   valuation adds the extra 10 for a soft hand.
+RANK_VALUE = (2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10, 1)
+RANK_IS_ACE = tuple(rank == 12 for rank in range(13))
 
-    @property
-    def rank_short_str(self):
-        """ str: A short representation of the rank of the Card. """
+# The same tables expanded per card, indexed by the encoded int
+#   directly so no rank extraction is needed on the dealing path.
+CARD_VALUE = tuple(RANK_VALUE[card >> 2] for card in range(52))
+IS_ACE = tuple(RANK_IS_ACE[card >> 2] for card in range(52))
 
-        if self.rank <= 8:
-            return str(self.rank + 2)
-        return ['J', 'Q', 'K', 'A'][self.rank - 9]
+CARD_STR = tuple(
+    RANK_SHORT[card >> 2] + SUIT_ICON[card & 3] for card in range(52)
+)
 
-    @property
-    def rank_long_str(self):
-        """ str: A long representation of the rank of the Card. """
+# The full 52-card pool in order, built once; shuffling copies it.
+FULL_DECK = tuple(range(52))
 
-        return [
-            'two', 'three', 'four', 'five', 'six', 'seven', 'eight',
-            'nine', 'ten', 'jack', 'queen', 'king', 'ace'
-        ][self.rank]
+# Set to True to suppress dealing narration, for batch/simulation use.
+silent = False
 
-    @property
-    def suit_icon_str(self):
-        """ str: A unicode icon representation of the suit of the Card. """
+# One shared PRNG for the whole module, seeded once from the OS
+#   entropy pool; its bound getrandbits is cached so draws skip the
+#   module and instance attribute lookups of the random functions.
+_rng = random.Random()
+_rng.seed(int.from_bytes(os.urandom(32), 'big'))
+_getrandbits = _rng.getrandbits
 
-        return ['♠', '♣', '♦', '♥'][self.suit]
+def shuffle_cards(cards):
+    """ Shuffle the `cards` list in place with a Fisher-Yates pass.
 
-    @property
-    def is_face_card(self):
-        """ bool: Whether Card is one that depicts a person. """
+    Each bounded index comes from mapping one 64-bit random word with
+      Lemire's multiply-shift, instead of random.shuffle's per-element
+      rejection sampling with division. For bounds this small the
+      mapping's bias is below 2**-58, negligible for dealing cards.
 
-        return self.rank > 8
+    """
 
-    def __str__(self):
-        rank = self.rank_short_str
-        suit = self.suit_icon_str
-        return rank + suit
+    getrandbits = _getrandbits
+    for i in range(len(cards) - 1, 0, -1):
+        j = getrandbits(64) * (i + 1) >> 64
+        cards[i], cards[j] = cards[j], cards[i]
 
 class Deck:
     """ A stack-based representation of a deck of playing cards.
 
-    A stack is used because this project is meant for practice on stacks,
-      among other things.
+    The stack is an array('B') byte buffer, one byte per card, so
+      push and pop are O(1) operations at the end of one contiguous
+      52-byte allocation with no per-card links or pointers.
+
+    A Deck created with Deck.random is shuffled lazily: each card
+      gets its Fisher-Yates swap only when it is dealt, so a game
+      that uses 4-10 cards pays for that many draw steps instead of
+      shuffling all 52 cards up front. Dealing every card performs a
+      complete Fisher-Yates pass, so the order is uniform either way.
 
     Attributes:
-        top_card (Card): The top card of the Deck, which is to be dealt first.
+        cards (array of int): The cards in the Deck, with the last
+            one on top, to be dealt first.
+        shuffle_lazily (bool): Whether cards still need their shuffle
+            step when dealt.
 
     """
 
-    def __init__(self, top_card=None):
-        self.top_card = top_card
+    __slots__ = ('cards', 'shuffle_lazily')
+
+    def __init__(self, cards=(), shuffle_lazily=False):
+        self.cards = array('B', cards)
+        self.shuffle_lazily = shuffle_lazily
 
     def push(self, card):
-        card.next_card = self.top_card
-        self.top_card = card
+        self.cards.append(card)
 
-    def pop(self):
-        card = self.top_card
-        self.top_card = card.next_card
-        return card
+    def _shuffle_step(self, i):
+        """ Swap the card at `i` with a uniform pick from 0..i. """
 
-    @staticmethod
-    def random():
-        """ Return a standard Deck of 52 cards, suffled. """
+        j = _getrandbits(64) * (i + 1) >> 64
+        cards = self.cards
+        cards[i], cards[j] = cards[j], cards[i]
 
-        cards = []
-        for rank in range(13):
-            for suit in range(4):
-                cards.append(Card(rank, suit))
+    def pop(self):
+        i = len(self.cards) - 1
+        if self.shuffle_lazily and i > 0:
+            self._shuffle_step(i)
+        return self.cards.pop()
 
-        random.shuffle(cards)
+    def deal(self, amount):
+        """ Remove and return the top `amount` cards as a list. """
 
-        deck = Deck()
-        for card in cards:
-            deck.push(card)
+        if self.shuffle_lazily:
+            top = len(self.cards) - 1
+            for i in range(top, top - amount, -1):
+                if i > 0:
+                    self._shuffle_step(i)
 
-        return deck
+        dealt = self.cards[-amount:]
+        del self.cards[-amount:]
+        return dealt
 
-class Chip:
-    """ A representation of a casino chip (token).
+    @staticmethod
+    def random():
+        """ Return a standard Deck of 52 cards, suffled lazily. """
 
-    Attributes:
-        value (int): Chip denomination; the value of a single chip.
-        type (str): Unique representation of chip's type, like color.
+        return Deck(FULL_DECK, shuffle_lazily=True)
 
-    """
+# A chip stack is a dict keyed by (value, type) pairs like
+#   (5, 'red'), storing the amount of chips of that denomination.
+# No object is allocated per chip; moving chips around is pure count
+#   arithmetic.
 
-    def __init__(self, value, chip_type):
-        self.value = value
-        self.type = chip_type
+def merge_chips(stack, chips):
+    """ Add the chip amounts from `chips` into the `stack` dict. """
+
+    for chip_key, chip_amount in chips.items():
+        stack[chip_key] = stack.get(chip_key, 0) + chip_amount
 
 class BasePlayer:
     """ A representation of a person who can participate in the game. """
@@ -114,51 +135,46 @@ class BasePlayer:
     def __init__(self):
         self.hand = []
         self.split_hand = None
-        self.chips = []
+        self.chips = {}
+        self._hard_total = 0
+        self._num_aces = 0
 
     def remove_chips(self, amount):
         """ Remove chips from player's stack.
 
         Remove chips in decreasing value until total value of `amount`
-          chips have been removed.
+          chips have been removed. Return the removed chips as a stack
+          dict of their own.
 
         """
 
-        new_stack = []
+        removed_chips = {}
         remaining_amount = amount
 
-        self.chips.sort(key=lambda chip: chip.value, reverse=True)
-        for chip in self.chips[:]:
-            if chip.value <= remaining_amount:
-                new_stack.append(chip)
-                self.chips.remove(chip)
-                remaining_amount -= chip.value
-
-        return new_stack
+        for chip_key in sorted(self.chips, reverse=True):
+            chip_value = chip_key[0]
+            chip_amount = min(self.chips[chip_key],
+                              remaining_amount // chip_value)
+            if chip_amount > 0:
+                removed_chips[chip_key] = chip_amount
+                self.chips[chip_key] -= chip_amount
+                remaining_amount -= chip_amount * chip_value
 
-    def get_chips_by_type(self):
-        """ Return list of chip types and dictionary of amounts by type. """
+        return removed_chips
 
-        chip_types = []
-        chip_amount_by_type = {}
+    def add_chips(self, chips):
+        """ Add a stack dict of chips to player's stack. """
 
-        for chip in self.chips:
-            if chip_amount_by_type.get(chip.type) is None:
-                chip_amount_by_type[chip.type] = 0
-                chip_types.append((chip.value, chip.type))
-            chip_amount_by_type[chip.type] += 1
-        chip_types.sort(key=lambda tup: tup[0])
-
-        return (chip_types, chip_amount_by_type)
+        merge_chips(self.chips, chips)
 
     def print_chips(self):
         """ Print amount of every chip type in stack, and total value. """
 
-        chip_types, chip_amount_by_type = self.get_chips_by_type()
         total_value = 0
 
-        for chip_value, chip_type in chip_types:
-            chip_amount = chip_amount_by_type[chip_type]
+        for (chip_value, chip_type), chip_amount in sorted(self.chips.items()):
+            if chip_amount == 0:
+                continue
             print(f'{chip_amount} {chip_type} (${chip_value}) chips')
 
             total_value += chip_amount * chip_value
@@ -168,17 +184,14 @@ class BasePlayer:
     def check_bet(self, bet_value):
         """ Check whether bet can be placed with current chip stacks. """
 
-        chip_types, chip_amount_by_type = self.get_chips_by_type()
-        chip_types.reverse()
-
         remaining_value = bet_value
-        for chip_value, chip_type in chip_types:
-            available_amount = chip_amount_by_type[chip_type]
+        for chip_key in sorted(self.chips, reverse=True):
+            chip_value = chip_key[0]
+            available_amount = self.chips[chip_key]
             if available_amount * chip_value >= remaining_value:
-                chip_amount = int(remaining_value / chip_value)
+                chip_amount = remaining_value // chip_value
 
                 remaining_value -= chip_amount * chip_value
-                chip_amount_by_type[chip_type] -= chip_amount
 
                 if remaining_value == 0:
                     break
@@ -191,55 +204,70 @@ class BasePlayer:
     def chip_value(self):
         """ Calculate the total value of chips in player's stack. """
 
-        chip_types, chip_amount_by_type = self.get_chips_by_type()
-        total_value = 0
-
-        for chip_value, chip_type in chip_types:
-            chip_amount = chip_amount_by_type[chip_type]
-            total_value += chip_amount * chip_value
-
-        return total_value
+        return sum(
+            chip_value * chip_amount
+            for (chip_value, _), chip_amount in self.chips.items()
+        )
 
     @property
     def hand_value(self):
-        """ Calculate the total value of cards in a hand (list). """
-
-        total_card_value = 0
-
-        for card in self.hand:
-            if card.is_face_card:
-                if card.rank_long_str == 'ace':
-                    # If card is an ace, it is valued as 1
-                    #   if valuing it as 11 would lead to a bust.
-                    if total_card_value + 11 > 21:
-                        total_card_value += 1
-                    else:
-                        total_card_value += 11
-                else:
-                    total_card_value += 10
-            else:
-                # A numeric card is valued according to its numeric value.
-                total_card_value += card.rank + 2
+        """ Calculate the total value of cards in a hand (list).
+
+        Uses the running hard total and ace count kept up to date as
+          cards are dealt, instead of re-scanning the hand. An ace is
+          counted as 11 only if that does not lead to a bust.
 
+        """
+
+        total_card_value = self._hard_total
+        if self._num_aces and total_card_value + 10 <= 21:
+            return total_card_value + 10
         return total_card_value
 
 class Dealer(BasePlayer):
     """ A representation of a card dealer. """
 
-    def deal(self, deck, player, player_name):
-        """ Deal a single Card from `deck` to `player`s hand. """
+    def _add_card(self, player, card):
+        """ Add a dealt card to `player`s hand and running totals. """
 
-        card = deck.pop()
         player.hand.append(card)
-        print(f'Dealer deals {player_name} {card}')
+        player._hard_total += CARD_VALUE[card]
+        player._num_aces += IS_ACE[card]
+
+    def _deal_card(self, deck, player):
+        """ Move the top card of `deck` to `player`s hand, silently. """
+
+        card = deck.pop()
+        self._add_card(player, card)
+        return card
+
+    def deal(self, deck, player, player_name):
+        """ Deal a single card from `deck` to `player`s hand. """
+
+        card = self._deal_card(deck, player)
+        if not silent:
+            print(f'Dealer deals {player_name} {CARD_STR[card]}')
 
     def deal_initial(self, deck, player):
-        """ Deal to player and dealer 2 cards each, for game start. """
+        """ Deal to player and dealer 2 cards each, for game start.
+
+        Each 2-card hand comes off the deck as a single slice; the
+          deck is uniformly shuffled, so this is equivalent to dealing
+          the four cards alternately.
+        The four deal announcements are joined into a single print.
+
+        """
+
+        messages = []
+        for target, player_name in ((player, 'you'), (self, 'himself')):
+            for card in deck.deal(2):
+                self._add_card(target, card)
+                messages.append(
+                    f'Dealer deals {player_name} {CARD_STR[card]}'
+                )
 
-        self.deal(deck, player, 'you')
-        self.deal(deck, self, 'himself')
-        self.deal(deck, player, 'you')
-        self.deal(deck, self, 'himself')
+        if not silent:
+            print('\n'.join(messages))
 
 class Player(BasePlayer):
     """ A representation of a blackjack player. """
@@ -248,13 +276,19 @@ def prompt_number(min_num, max_num, out_of_bound_message=None):
     while True:
         number_input = input()
 
-        try:
-            number_input = int(number_input)
-        except ValueError:
-            print('Please input an integer.')
-            continue
+        if len(number_input) == 1 and '0' <= number_input <= '9':
+            # Fast path for single-digit menu picks: one subtraction
+            #   instead of the full int() parse, and no exception
+            #   machinery on the typical non-numeric typo.
+            number_input = ord(number_input) - 48
+        else:
+            try:
+                number_input = int(number_input)
+            except ValueError:
+                print('Please input an integer.')
+                continue
 
-        if number_input not in range(min_num, max_num + 1):
+        if not min_num <= number_input <= max_num:
             print(out_of_bound_message)
             continue
 
@@ -262,14 +296,23 @@ def prompt_number(min_num, max_num, out_of_bound_message=None):
 
     return number_input
 
+@functools.lru_cache(maxsize=None)
+def menu_str(choices):
+    """ Return the numbered menu string for a tuple of choices.
+
+    The same few menus recur on every hand, so each built string is
+      cached and reused.
+
+    """
+
+    return '\n'.join(f'{i + 1}. {choice}' for i, choice in enumerate(choices))
+
 def prompt_choice(choices):
     """ Prompt for a choice until a valid response is given. """
 
-    print()
-    print('What do you want to do?')
+    choices = tuple(choices)
 
-    for i, choice in enumerate(choices):
-        print(f'{i + 1}. {choice}')
+    print(f'\nWhat do you want to do?\n{menu_str(choices)}')
 
     user_choice = prompt_number(
         1, len(choices), 'Please input one of the provided choices.'
@@ -292,32 +335,29 @@ def prompt_bet(min_bet, max_bet):
 
     return user_bet
 
+# Fixed choice menus, hoisted so prompt_choice always sees the same
+#   tuples and its cached menu strings are reused.
+PLAY_CHOICES = ('stand', 'hit', 'double down')
+PLAY_SPLIT_CHOICES = PLAY_CHOICES + ('split',)
+END_CHOICES = ('play again', 'quit')
+
 player = Player()
 dealer = Dealer()
 
-for chip_num, chip_value, chip_type in [
-        (0, 1, 'blue'),
-        (20, 5, 'red'),
-        (8, 25, 'green'),
-        (2, 100, 'black'),
-        (0, 500, 'purple'),
-        (0, 1000, 'orange')
-    ]:
-    for _ in range(chip_num):
-        chip = Chip(chip_value, chip_type)
-        player.chips.append(chip)
-
-for chip_num, chip_value, chip_type in [
-        (100, 1, 'blue'),
-        (20, 5, 'red'),
-        (12, 25, 'green'),
-        (5, 100, 'black'),
-        (2, 500, 'purple'),
-        (1, 1000, 'orange')
-    ]:
-    for _ in range(chip_num):
-        chip = Chip(chip_value, chip_type)
-        dealer.chips.append(chip)
+player.chips = {
+    (5, 'red'): 20,
+    (25, 'green'): 8,
+    (100, 'black'): 2,
+}
+
+dealer.chips = {
+    (1, 'blue'): 100,
+    (5, 'red'): 20,
+    (25, 'green'): 12,
+    (100, 'black'): 5,
+    (500, 'purple'): 2,
+    (1000, 'orange'): 1,
+}
 
 def game():
     """ Play a single blackjack session. """
@@ -332,7 +372,11 @@ def game():
     first_move = True
 
     player.hand = []
+    player._hard_total = 0
+    player._num_aces = 0
     dealer.hand = []
+    dealer._hard_total = 0
+    dealer._num_aces = 0
 
     print('Dealer shuffles a deck of cards.')
     deck = Deck.random()
@@ -380,9 +424,9 @@ def game():
     dealer.deal_initial(deck, player)
 
     while True:
-        print()
-        print('Your hand:', ', '.join(map(str, player.hand)))
-        print("Dealer's hand:", ', '.join(map(str, dealer.hand)))
+        player_hand = ', '.join([CARD_STR[card] for card in player.hand])
+        dealer_hand = ', '.join([CARD_STR[card] for card in dealer.hand])
+        print(f"\nYour hand: {player_hand}\nDealer's hand: {dealer_hand}")
 
         if first_move and player.hand_value == 21:
             print()
@@ -390,25 +434,26 @@ def game():
 
             win_amount = math.ceil(player_bet * 3 / 2)
             win_chips = dealer.remove_chips(win_amount)
-            player.chips += player_bet_chips + win_chips
+            player.add_chips(player_bet_chips)
+            player.add_chips(win_chips)
             print(f'You win ${win_amount + player_bet}.')
             break
 
         game_done = False
 
-        choices = ['stand', 'hit', 'double down']
+        choices = PLAY_CHOICES
         if len(player.hand) == 2 and player.split_hand is None:
-            card_1_rank = player.hand[0].rank
-            card_2_rank = player.hand[1].rank
+            card_1_rank = player.hand[0] >> 2
+            card_2_rank = player.hand[1] >> 2
             if card_1_rank == card_2_rank:
-                choices.append('split')
+                choices = PLAY_SPLIT_CHOICES
 
         choice = prompt_choice(choices)
         print()
         if choice in ['stand', 'double down']:
             if choice == 'double down':
                 dealer.deal(deck, player, 'you')
-                player_bet_chips += player.remove_chips(player_bet)
+                merge_chips(player_bet_chips, player.remove_chips(player_bet))
                 player_bet *= 2
                 print()
 
@@ -421,7 +466,7 @@ def game():
                     f'have the same hand value of {player_hand_value}.'
                 )
 
-                player.chips += player_bet_chips
+                player.add_chips(player_bet_chips)
                 print(f'You get your ${player_bet} back.')
             elif player_hand_value > dealer_hand_value:
                 print(
@@ -430,7 +475,8 @@ def game():
                 )
 
                 win_chips = dealer.remove_chips(player_bet)
-                player.chips += player_bet_chips + win_chips
+                player.add_chips(player_bet_chips)
+                player.add_chips(win_chips)
                 print(f'You win ${player_bet * 2}.')
             else:
                 print(
@@ -449,9 +495,10 @@ def game():
                 print(f'You have busted with hand value of {hand_value}.')
                 game_done = True
         elif choice == 'split':
-            second_card = player.hand[1]
-            player.hand.remove(second_card)
+            second_card = player.hand.pop(1)
             player.split_hand = [second_card]
+            player._hard_total -= CARD_VALUE[second_card]
+            player._num_aces -= IS_ACE[second_card]
 
             player.remove_chips(player_bet)
 
@@ -464,6 +511,9 @@ def game():
 
                 player.hand = player.split_hand
                 player.split_hand = None
+                split_card = player.hand[0]
+                player._hard_total = CARD_VALUE[split_card]
+                player._num_aces = int(IS_ACE[split_card])
 
                 print()
                 dealer.deal(deck, player, 'you')
@@ -472,12 +522,13 @@ def game():
 
         first_move = False
 
-game()
+if __name__ == '__main__':
+    game()
 
-while True:
-    choice = prompt_choice(['play again', 'quit'])
-    if choice == 'play again':
-        print()
-        game()
-    elif choice == 'quit':
-        break
+    while True:
+        choice = prompt_choice(END_CHOICES)
+        if choice == 'play again':
+            print()
+            game()
+        elif choice == 'quit':
+            break
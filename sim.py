@@ -0,0 +1,90 @@
+""" Batch blackjack simulation, for strategy evaluation.
+
+Plays many hands back to back with no input or printing, reusing the
+  card tables from main. The player follows a simple hit-below-
+  threshold strategy and the dealer draws to 17.
+
+"""
+
+from main import CARD_VALUE, FULL_DECK, IS_ACE, shuffle_cards
+
+def hand_value(hard_total, num_aces):
+    """ Return the blackjack value for a running hard total. """
+
+    if num_aces and hard_total + 10 <= 21:
+        return hard_total + 10
+    return hard_total
+
+def play_hand(deck, stand_threshold=17):
+    """ Play a single hand with no I/O, drawing from the end of `deck`.
+
+    The player hits below `stand_threshold` and the dealer hits below
+      17. Return 1 for a player win, 0 for a push and -1 for a loss.
+
+    """
+
+    player_total = 0
+    player_aces = 0
+    dealer_total = 0
+    dealer_aces = 0
+
+    # Initial deal, alternating like Dealer.deal_initial.
+    for _ in range(2):
+        card = deck.pop()
+        player_total += CARD_VALUE[card]
+        player_aces += IS_ACE[card]
+
+        card = deck.pop()
+        dealer_total += CARD_VALUE[card]
+        dealer_aces += IS_ACE[card]
+
+    while hand_value(player_total, player_aces) < stand_threshold:
+        card = deck.pop()
+        player_total += CARD_VALUE[card]
+        player_aces += IS_ACE[card]
+
+    player_value = hand_value(player_total, player_aces)
+    if player_value > 21:
+        return -1
+
+    while hand_value(dealer_total, dealer_aces) < 17:
+        card = deck.pop()
+        dealer_total += CARD_VALUE[card]
+        dealer_aces += IS_ACE[card]
+
+    dealer_value = hand_value(dealer_total, dealer_aces)
+    if dealer_value > 21 or player_value > dealer_value:
+        return 1
+    if player_value == dealer_value:
+        return 0
+    return -1
+
+def simulate(num_hands, stand_threshold=17):
+    """ Play `num_hands` hands and return (wins, pushes, losses). """
+
+    wins = 0
+    pushes = 0
+    losses = 0
+
+    deck = list(FULL_DECK)
+    for _ in range(num_hands):
+        deck[:] = FULL_DECK
+        shuffle_cards(deck)
+
+        outcome = play_hand(deck, stand_threshold)
+        if outcome > 0:
+            wins += 1
+        elif outcome < 0:
+            losses += 1
+        else:
+            pushes += 1
+
+    return (wins, pushes, losses)
+
+if __name__ == '__main__':
+    wins, pushes, losses = simulate(100000)
+    num_hands = wins + pushes + losses
+    print(
+        f'{num_hands} hands: {wins} wins, '
+        f'{pushes} pushes, {losses} losses'
+    )